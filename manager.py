@@ -14,18 +14,194 @@ Features:
 API Version: 1.0.0
 """
 
+import functools
+import inspect
 import logging
 import os
+import threading
 import time
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from src.plugin_system.base_plugin import BasePlugin
 from src.common.scroll_helper import ScrollHelper
 
+# freetype-py is only needed for BDF fonts that Pillow can't load.
+# It raises RuntimeError (not ImportError) when the libfreetype shared library is missing.
+try:
+    import freetype
+except (ImportError, RuntimeError, OSError):
+    freetype = None
+
 logger = logging.getLogger(__name__)
 
+# Rasterized glyph coverage masks shared across plugin instances.
+# Key: (character, font key from TextDisplayPlugin._load_font)
+# Value: (coverage mask (h, w) uint8, left, top, advance)
+_GLYPH_CACHE: Dict[Tuple[str, Tuple], Tuple[np.ndarray, int, int, float]] = {}
+
+# Resolved font file paths, only for fonts that were found.
+# Key: (configured font_path, working directory)
+_FONT_PATHS: Dict[Tuple[str, str], str] = {}
+
+# Font key for Pillow's built-in default font (used whenever the configured font can't be loaded)
+_DEFAULT_FONT_KEY = ('default',)
+
+# Characters always packed into the glyph atlas (printable ASCII)
+_ATLAS_CHARS = ''.join(chr(c) for c in range(32, 127))
+
+# Rendered (read-only) text cache strips shared across plugin instances, least recently used first.
+# Bounded by total size rather than entry count - a long ticker strip can be several MB.
+# Key: (text, font key, text_color, bg_color, scroll_gap_width, matrix_width, matrix_height)
+_TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_TEXT_CACHE: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_TEXT_CACHE_BYTES = 0
+# Instances build their caches on background threads
+_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _compose_line_mask(line_mask, atlas, src_x, widths, dst_x):
+    """
+    Composite glyph columns from the atlas into line_mask in a single pass (see _composite_over).
+    
+    Glyph i copies atlas columns src_x[i]:src_x[i]+widths[i] to line_mask columns starting at
+    dst_x[i]; columns outside line_mask are skipped. Only used JIT-compiled (see _get_compose_kernel).
+    """
+    height = atlas.shape[0]
+    line_width = line_mask.shape[1]
+    for i in range(dst_x.shape[0]):
+        for xx in range(widths[i]):
+            col = dst_x[i] + xx
+            if col < 0 or col >= line_width:
+                continue
+            src = src_x[i] + xx
+            for yy in range(height):
+                m = atlas[yy, src]
+                if m:
+                    t = line_mask[yy, col] * (255 - m) + 128
+                    line_mask[yy, col] = m + (((t >> 8) + t) >> 8)
+
+
+# Numba is optional and only pays for itself on very long messages: importing it costs ~70 MB and a
+# few hundred ms, plus the kernel compile/cache load, against a few ms saved per 20k characters.
+# So it's imported on first use, and only for line masks at least this many columns wide.
+_JIT_MIN_COLUMNS = 150_000
+# Compiled kernel (None until first needed), and whether numba turned out to be unusable
+_compose_line_mask_jit = None
+_jit_unavailable = False
+
+
+def _get_compose_kernel():
+    """Return the compiled _compose_line_mask, importing numba on first use (None if unavailable)."""
+    global _compose_line_mask_jit, _jit_unavailable
+    if _jit_unavailable:
+        return None
+    if _compose_line_mask_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _jit_unavailable = True
+            return None
+        _compose_line_mask_jit = njit(cache=True)(_compose_line_mask)
+    return _compose_line_mask_jit
+
+
+def _composite_over(dst: np.ndarray, src: np.ndarray) -> np.ndarray:
+    """
+    Return glyph coverage src composited over coverage dst, the way Pillow's renderer merges glyphs.
+    
+    src + dst * (255 - src) / 255, rounded with the exact shift-based division by 255.
+    """
+    src = src.astype(np.uint16)
+    t = dst.astype(np.uint16) * (255 - src) + 128
+    return src + (((t >> 8) + t) >> 8)
+
+
+def _fill_rgb(arr: np.ndarray, color: Tuple[int, int, int]):
+    """
+    Fill an (h, w, 3) uint8 array with a solid color.
+    
+    Broadcasting a 3-tuple over a large array is slow in NumPy, so fill one row and copy it down.
+    """
+    arr[0] = color
+    arr[1:] = arr[0]
+
+
+def _parse_color(raw) -> Tuple[int, int, int]:
+    """
+    Convert a configured color (list of numbers or numeric strings from JSON) to an RGB tuple.
+    
+    Raises:
+        ValueError: If it isn't three values in 0-255 (the uint8 render paths can't represent those)
+        TypeError: If it isn't a sequence of numbers
+    """
+    color = tuple(int(c) for c in raw)
+    if len(color) != 3 or not all(0 <= c <= 255 for c in color):
+        raise ValueError(f"expected 3 values in 0-255, got {list(raw)}")
+    return color
+
+
+def _resolve_font_path(font_path: str) -> Optional[str]:
+    """
+    Resolve a configured font path to an existing file.
+    
+    Found paths are memoized so font reloads don't repeat the filesystem probes (slow on SD cards);
+    misses aren't, so a font file that appears later is picked up on the next load.
+    
+    Returns:
+        The resolved path, or None if the font file can't be found
+    """
+    # Relative paths are probed against the working directory, so it is part of the key
+    key = (font_path, os.getcwd())
+    resolved = _FONT_PATHS.get(key)
+    if resolved is None:
+        resolved = _probe_font_path(font_path)
+        if resolved is not None:
+            _FONT_PATHS[key] = resolved
+    return resolved
+
+
+def _probe_font_path(font_path: str) -> Optional[str]:
+    """Look for the font file on disk (see _resolve_font_path)."""
+    # Resolve relative paths to project root
+    if not os.path.isabs(font_path):
+        # Strategy 1: Try as-is (if running from project root)
+        if os.path.exists(font_path):
+            return font_path
+        
+        # Strategy 2: Try relative to current working directory (project root)
+        cwd_path = os.path.join(os.getcwd(), font_path)
+        if os.path.exists(cwd_path):
+            return cwd_path
+        
+        # Strategy 3: Try relative to plugin directory's parent (project root)
+        # Get the plugin directory (assuming we're in plugins/text-display/)
+        plugin_dir = Path(__file__).parent
+        project_root = plugin_dir.parent.parent
+        project_path = project_root / font_path
+        if project_path.exists():
+            return str(project_path)
+        return None
+    
+    return font_path if os.path.exists(font_path) else None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_truetype(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TTF font, sharing the parsed face between plugin instances and config reloads."""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_bdf(font_path: str) -> ImageFont.ImageFont:
+    """Parse a BDF font into a Pillow ImageFont (needs Pillow 10.1+), cached like _load_truetype."""
+    from PIL import BdfFontFile
+    with open(font_path, 'rb') as fp:
+        return BdfFontFile.BdfFontFile(fp).to_imagefont()
+
 
 class TextDisplayPlugin(BasePlugin):
     """
@@ -52,6 +228,8 @@ class TextDisplayPlugin(BasePlugin):
         
         # Configuration
         self.text = config.get('text', 'Hello, World!')
+        # Code points of the text, for vectorized glyph atlas lookups
+        self._codes = np.fromiter(map(ord, self.text), dtype=np.uint32, count=len(self.text))
         self.font_path = config.get('font_path', 'assets/fonts/PressStart2P-Regular.ttf')
         self.font_size = config.get('font_size', 8)
         self.scroll_enabled = config.get('scroll', True)
@@ -75,8 +253,8 @@ class TextDisplayPlugin(BasePlugin):
         try:
             text_color_raw = config.get('text_color', [255, 255, 255])
             bg_color_raw = config.get('background_color', [0, 0, 0])
-            self.text_color = tuple(int(c) for c in text_color_raw)
-            self.bg_color = tuple(int(c) for c in bg_color_raw)
+            self.text_color = _parse_color(text_color_raw)
+            self.bg_color = _parse_color(bg_color_raw)
         except (ValueError, TypeError) as e:
             self.logger.error(f"Invalid color values in config: {e}")
             # Use defaults if conversion fails
@@ -84,23 +262,65 @@ class TextDisplayPlugin(BasePlugin):
             self.bg_color = (0, 0, 0)
         
         # State
-        self.font = self._load_font()
+        # Key of the font actually loaded (see _load_font); glyph, atlas and strip caches use it
+        self.font, self._font_key = self._load_font()
         self.text_width = 0
+        self._text_bbox = None
         self.text_image_cache = None
+        # Matrix dimensions (see _refresh_matrix_dims)
+        self._matrix_width = 0
+        self._matrix_height = 0
+        # Persistent buffer for the visible scroll window
+        self._frame_arr = None
+        # Reusable frame for the fallback render paths (allocated on first use)
+        self._fallback_img = None
+        self._fallback_draw = None
+        # Integer scroll position of the last frame pushed (None forces the next frame)
+        self._last_scroll_px = None
+        # Last rendered static frame and the settings it was rendered with
+        self._static_image = None
+        self._static_draw = None
+        self._static_key = None
+        # Whether the current static frame has already been pushed to the matrix
+        self._static_shown = False
+        # Glyph atlas for the current font (built on first cache render)
+        self._atlas = None
+        self._atlas_key = None
+        self._glyph_codes = np.empty(0, dtype=np.uint32)
+        # Coverage mask of the laid-out text and the (text, font key) it was built for
+        self._line_mask = None
+        self._line_mask_key = None
+        # Strip array text_image_cache was made from (shared with _TEXT_CACHE and, when it accepts one, ScrollHelper)
+        self._cache_view = None
+        # Strip columns [start, end) that contain text, and whether the last frame pushed was background only
+        self._ink_cols = None
+        self._blank_pushed = False
+        # (cache state, matrix size) the current scroll cache was built for, and of the last build that failed
+        # (so it isn't retried every frame)
+        self._cache_sig = None
+        self._cache_failed_state = None
         
         # Frame rate tracking for FPS logging
         self.frame_count = 0
         self.last_frame_time = None
-        self.last_fps_log_time = None
-        self.frame_times = []
+        self._next_fps_log = 0.0
+        # Ring buffer of the last 100 frame times with a running sum for the average
+        self._ft_buf = np.zeros(100, dtype=np.float64)
+        self._ft_idx = 0
+        self._ft_sum = 0.0
+        self._ft_n = 0
         
-        # Calculate text dimensions
-        self._calculate_text_dimensions()
+        # Optional display manager hook, resolved once instead of with hasattr() every frame
+        self._set_scrolling_state = getattr(self.display_manager, 'set_scrolling_state', None)
         
         # Initialize ScrollHelper for scrolling functionality
-        display_width = self.display_manager.matrix.width if hasattr(self.display_manager, 'matrix') else 128
-        display_height = self.display_manager.matrix.height if hasattr(self.display_manager, 'matrix') else 32
-        self.scroll_helper = ScrollHelper(display_width, display_height, logger=self.logger)
+        self._refresh_matrix_dims()
+        self.scroll_helper = ScrollHelper(self._matrix_width, self._matrix_height, logger=self.logger)
+        # Newer ScrollHelper versions accept a prebuilt array and skip their own np.array() copy
+        try:
+            self._scroll_helper_takes_array = 'array' in inspect.signature(self.scroll_helper.set_scrolling_image).parameters
+        except (TypeError, ValueError):
+            self._scroll_helper_takes_array = False
         
         # Configure ScrollHelper with plugin settings
         # Use frame-based scrolling for smoother visual movement on LED matrix
@@ -121,8 +341,7 @@ class TextDisplayPlugin(BasePlugin):
                 )
         else:
             # Fallback for older ScrollHelper: convert to pixels/second
-            pixels_per_second = self.scroll_speed / self.scroll_delay if self.scroll_delay > 0 else self.scroll_speed * 100
-            self.scroll_helper.set_scroll_speed(pixels_per_second)
+            self.scroll_helper.set_scroll_speed(self._pixels_per_second())
             
         self.scroll_helper.set_scroll_delay(self.scroll_delay)
         
@@ -132,9 +351,8 @@ class TextDisplayPlugin(BasePlugin):
         # Sub-pixel scrolling disabled - using high frame rate integer scrolling for smoothness
         # This matches the behavior of stock/leaderboard tickers
         
-        # Calculate pixels per second for logging (even though we use frame-based mode)
-        pixels_per_second = self.scroll_speed / self.scroll_delay if self.scroll_delay > 0 else self.scroll_speed * 100
-        self.logger.info(f"Scroll settings: {self.scroll_speed} px/frame, {self.scroll_delay}s delay = {pixels_per_second:.1f} px/s, target FPS: {target_fps}")
+        # Log pixels per second too (even though we use frame-based mode)
+        self.logger.info(f"Scroll settings: {self.scroll_speed} px/frame, {self.scroll_delay}s delay = {self._pixels_per_second():.1f} px/s, target FPS: {target_fps}")
         self.scroll_helper.set_dynamic_duration_settings(
             enabled=True,
             min_duration=10,
@@ -145,9 +363,39 @@ class TextDisplayPlugin(BasePlugin):
         # Register fonts
         self._register_fonts()
         
+        # Measure the text and pre-render the scroll cache off the startup path;
+        # display()/update() don't render until this has finished
+        self._cache_ready = threading.Event()
+        threading.Thread(target=self._build_cache_bg, name=f"{self.plugin_id}-text-cache", daemon=True).start()
+        
         self.logger.info(f"Text display plugin initialized: '{self.text[:30]}...'")
         self.logger.info(f"Font: {self.font_path}, Size: {self.font_size}, Scroll: {self.scroll_enabled}")
     
+    def _refresh_matrix_dims(self):
+        """
+        Cache the matrix dimensions so hot paths don't walk display_manager.matrix every frame.
+        
+        Only called from __init__: ScrollHelper is created with these dimensions, so a matrix of a
+        different size needs a new plugin instance rather than another call.
+        """
+        width = self.display_manager.matrix.width if hasattr(self.display_manager, 'matrix') else 128
+        height = self.display_manager.matrix.height if hasattr(self.display_manager, 'matrix') else 32
+        if (width, height) != (self._matrix_width, self._matrix_height):
+            self._matrix_width = width
+            self._matrix_height = height
+            self.text_image_cache = None
+    
+    def _build_cache_bg(self):
+        """Calculate text dimensions and build the scroll cache (runs on a background thread)."""
+        try:
+            self._calculate_text_dimensions()
+            if self.scroll_enabled and self.text_width > self._matrix_width:
+                self._create_text_cache()
+        except Exception as e:
+            self.logger.error(f"Error building text cache in background: {e}", exc_info=True)
+        finally:
+            self._cache_ready.set()
+    
     def _register_fonts(self):
         """Register fonts with the font manager."""
         try:
@@ -168,78 +416,68 @@ class TextDisplayPlugin(BasePlugin):
         except Exception as e:
             self.logger.warning(f"Error registering fonts: {e}")
     
-    def _load_font(self):
-        """Load the specified font file (TTF or BDF)."""
-        font_path = self.font_path
-        
-        # Resolve relative paths to project root
-        if not os.path.isabs(font_path):
-            # Try multiple resolution strategies
-            resolved_path = None
-            
-            # Strategy 1: Try as-is (if running from project root)
-            if os.path.exists(font_path):
-                resolved_path = font_path
-            else:
-                # Strategy 2: Try relative to current working directory (project root)
-                cwd_path = os.path.join(os.getcwd(), font_path)
-                if os.path.exists(cwd_path):
-                    resolved_path = cwd_path
-                else:
-                    # Strategy 3: Try relative to plugin directory's parent (project root)
-                    # Get the plugin directory (assuming we're in plugins/text-display/)
-                    plugin_dir = Path(__file__).parent
-                    project_root = plugin_dir.parent.parent
-                    project_path = project_root / font_path
-                    if project_path.exists():
-                        resolved_path = str(project_path)
-            
-            if resolved_path:
-                font_path = resolved_path
-            else:
-                self.logger.warning(f"Font file not found: {font_path}, using default")
-                return ImageFont.load_default()
+    def _load_font(self) -> Tuple[Any, Tuple]:
+        """
+        Load the specified font file (TTF or BDF).
         
-        if not os.path.exists(font_path):
-            self.logger.warning(f"Font file not found: {font_path}, using default")
-            return ImageFont.load_default()
+        Returns:
+            (font, font key) - the key names the font that was actually loaded (how and from which
+            resolved file), so glyphs and strips rendered with a fallback font are never shared
+            under the configured font's name
+        """
+        font_path = _resolve_font_path(self.font_path)
+        if font_path is None:
+            self.logger.warning(f"Font file not found: {self.font_path}, using default")
+            return ImageFont.load_default(), _DEFAULT_FONT_KEY
         
         try:
             if font_path.lower().endswith('.ttf'):
-                font = ImageFont.truetype(font_path, self.font_size)
+                font = _load_truetype(font_path, self.font_size)
                 self.logger.info(f"Loaded TTF font: {font_path}")
-                return font
+                return font, ('ttf', font_path, self.font_size)
             elif font_path.lower().endswith('.bdf'):
-                # BDF fonts need freetype
+                # Pillow parses BDF natively into an ImageFont, so measuring and the glyph atlas
+                # work the same as for TTF. Bitmap fonts have a fixed pixel size (font_size is ignored).
                 try:
-                    import freetype
-                    face = freetype.Face(font_path)
-                    face.set_pixel_sizes(0, self.font_size)
+                    font = _load_bdf(font_path)
                     self.logger.info(f"Loaded BDF font: {font_path}")
-                    return face
-                except ImportError:
+                    return font, ('bdf', font_path)
+                except Exception as e:
+                    # e.g. Pillow < 10.1 (no to_imagefont) or a BDF variant Pillow can't parse
+                    self.logger.warning(f"Pillow could not load BDF font {font_path} ({e}), trying freetype")
+                
+                # Fall back to freetype (not cached - selecting a size mutates the face)
+                if freetype is None:
                     self.logger.warning("freetype not available for BDF font, using default")
-                    return ImageFont.load_default()
+                    return ImageFont.load_default(), _DEFAULT_FONT_KEY
+                face = freetype.Face(font_path)
+                if face.is_scalable:
+                    face.set_pixel_sizes(0, self.font_size)
+                else:
+                    # Bitmap strikes only exist at their native sizes
+                    face.select_size(0)
+                self.logger.info(f"Loaded BDF font: {font_path}")
+                return face, ('freetype', font_path, self.font_size)
             else:
                 self.logger.warning(f"Unsupported font type: {font_path}")
-                return ImageFont.load_default()
+                return ImageFont.load_default(), _DEFAULT_FONT_KEY
         except Exception as e:
             self.logger.error(f"Failed to load font {font_path}: {e}")
-            return ImageFont.load_default()
+            return ImageFont.load_default(), _DEFAULT_FONT_KEY
     
     def _calculate_text_dimensions(self):
         """Calculate text width for scrolling."""
+        self._text_bbox = None
         if not self.text or not self.font:
             self.text_width = 0
             return
         
         try:
-            # Create temporary image to measure text
-            temp_img = Image.new('RGB', (1, 1))
-            temp_draw = ImageDraw.Draw(temp_img)
-            
-            if isinstance(self.font, ImageFont.FreeTypeFont) or isinstance(self.font, ImageFont.ImageFont):
-                bbox = temp_draw.textbbox((0, 0), self.text, font=self.font)
+            if self._uses_glyph_atlas() or self._is_pillow_font():
+                # One layout pass gives both the width and the height
+                bbox = self._measure_text_bbox()
+                # Keep the full bbox so cache creation doesn't have to shape the text again
+                self._text_bbox = bbox
                 self.text_width = bbox[2] - bbox[0]
             else:
                 # Default fallback
@@ -250,6 +488,305 @@ class TextDisplayPlugin(BasePlugin):
             self.logger.error(f"Error calculating text width: {e}")
             self.text_width = len(self.text) * 8
     
+    def _get_text_bbox(self) -> Tuple[int, int, int, int]:
+        """Return the text bbox, measuring it here only if _calculate_text_dimensions couldn't."""
+        if self._text_bbox is None:
+            self._text_bbox = self._measure_text_bbox()
+        return self._text_bbox
+    
+    def _measure_text_bbox(self) -> Tuple[int, int, int, int]:
+        """Measure the text's bbox with the pen at (0, 0)."""
+        if not self._uses_glyph_atlas():
+            # Drawn with draw.text (multiline / shaped text), so measure it the same way
+            temp_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+            return temp_draw.textbbox((0, 0), self.text, font=self.font)
+        if not self._is_freetype_face():
+            # Same result as textbbox((0, 0)) without a throwaway image and draw context
+            return self.font.getbbox(self.text)
+        
+        # freetype faces have no layout API - lay the cached glyphs out the way _get_line_mask does
+        glyphs = [self._get_glyph(ch) for ch in self.text]
+        advances = np.array([advance for _, _, _, advance in glyphs], dtype=np.float64)
+        pen = (np.cumsum(advances) - advances).astype(np.intp)
+        x0 = min(int(p) + left for p, (_, left, _, _) in zip(pen, glyphs))
+        x1 = max(int(p) + left + mask.shape[1] for p, (mask, left, _, _) in zip(pen, glyphs))
+        y0 = min(top for _, _, top, _ in glyphs)
+        y1 = max(top + mask.shape[0] for mask, _, top, _ in glyphs)
+        return x0, y0, x1, y1
+    
+    def _is_freetype_face(self) -> bool:
+        """Whether the font is the freetype.Face fallback for BDF fonts."""
+        return freetype is not None and isinstance(self.font, freetype.Face)
+    
+    def _is_pillow_font(self) -> bool:
+        """Whether the font is one of Pillow's font objects."""
+        return isinstance(self.font, (ImageFont.FreeTypeFont, ImageFont.ImageFont))
+    
+    def _uses_glyph_atlas(self) -> bool:
+        """
+        Whether the text can be laid out glyph by glyph from the atlas (Pillow fonts and freetype faces).
+        
+        Multiline text and fonts using the raqm layout (HarfBuzz kerning/ligatures apply to ASCII too)
+        are left to draw.text.
+        """
+        if self._is_pillow_font():
+            if '\n' in self.text:
+                return False
+            # Bitmap ImageFonts have no layout engine; FreeTypeFonts must use the basic one
+            return getattr(self.font, 'layout_engine', ImageFont.Layout.BASIC) == ImageFont.Layout.BASIC
+        # freetype faces have no layout of their own, so they always go through the atlas
+        return self._is_freetype_face()
+    
+    def _get_centered_y(self, matrix_height: int) -> int:
+        """Return the y offset that vertically centers the text's ink on the matrix."""
+        bbox = self._get_text_bbox()
+        text_height = bbox[3] - bbox[1]
+        return (matrix_height - text_height) // 2 - bbox[1]
+    
+    def _get_glyph(self, ch: str) -> Tuple[np.ndarray, int, int, float]:
+        """Return the cached (coverage mask, left, top, advance) for a character, rasterizing it on first use."""
+        key = (ch, self._font_key)
+        glyph = _GLYPH_CACHE.get(key)
+        if glyph is None:
+            if self._is_freetype_face():
+                glyph = self._rasterize_face_glyph(ch)
+            else:
+                left, top = self.font.getbbox(ch)[:2]
+                mask = self.font.getmask(ch, 'L')
+                width, height = mask.size
+                coverage = np.asarray(mask, dtype=np.uint8).reshape(height, width)
+                glyph = (coverage, left, top, self.font.getlength(ch))
+            _GLYPH_CACHE[key] = glyph
+        return glyph
+    
+    def _rasterize_face_glyph(self, ch: str) -> Tuple[np.ndarray, int, int, float]:
+        """Rasterize a character from the freetype face, with top measured from the ascender like Pillow does."""
+        face = self.font
+        face.load_char(ch, freetype.FT_LOAD_RENDER)
+        slot = face.glyph
+        bitmap = slot.bitmap
+        if bitmap.rows and bitmap.width:
+            rows = np.array(bitmap.buffer, dtype=np.uint8).reshape(bitmap.rows, abs(bitmap.pitch))
+            if bitmap.pixel_mode == freetype.FT_PIXEL_MODE_MONO:
+                # BDF strips are 1 bit per pixel, MSB first
+                coverage = np.unpackbits(rows, axis=1)[:, :bitmap.width] * np.uint8(255)
+            else:
+                coverage = np.ascontiguousarray(rows[:, :bitmap.width])
+        else:
+            coverage = np.zeros((bitmap.rows, bitmap.width), dtype=np.uint8)
+        top = (face.size.ascender >> 6) - slot.bitmap_top
+        return coverage, slot.bitmap_left, top, slot.advance.x / 64.0
+    
+    def _build_glyph_atlas(self, chars: str):
+        """Pack the coverage masks of chars side by side into a single L-mode atlas array."""
+        chars = sorted(set(chars))
+        glyphs = [self._get_glyph(ch) for ch in chars]
+        
+        # All glyphs share one baseline: row 0 of the atlas is the highest glyph top
+        atlas_top = min(top for _, _, top, _ in glyphs)
+        atlas_height = max(top + mask.shape[0] for mask, _, top, _ in glyphs) - atlas_top
+        widths = np.array([mask.shape[1] for mask, _, _, _ in glyphs], dtype=np.intp)
+        self._glyph_x = np.cumsum(widths) - widths
+        self._glyph_w = widths
+        self._glyph_left = np.array([left for _, left, _, _ in glyphs], dtype=np.intp)
+        self._glyph_advance = np.array([advance for _, _, _, advance in glyphs], dtype=np.float64)
+        # Sorted code points of the atlas glyphs; a glyph's index here is its slot in the per-glyph arrays
+        self._glyph_codes = np.array([ord(ch) for ch in chars], dtype=np.uint32)
+        
+        atlas = np.zeros((atlas_height, int(widths.sum())), dtype=np.uint8)
+        for (mask, _, top, _), x, w in zip(glyphs, self._glyph_x, widths):
+            atlas[top - atlas_top:top - atlas_top + mask.shape[0], x:x + w] = mask
+        self._atlas = atlas
+        self._atlas_top = atlas_top
+        self._atlas_key = self._font_key
+    
+    def _lookup_slots(self) -> Optional[np.ndarray]:
+        """Map the text's code points to atlas slots, or return None if the atlas is stale or missing glyphs."""
+        if self._atlas_key != self._font_key or self._glyph_codes.size == 0:
+            return None
+        slots = np.searchsorted(self._glyph_codes, self._codes)
+        np.minimum(slots, self._glyph_codes.size - 1, out=slots)
+        if not np.array_equal(self._glyph_codes[slots], self._codes):
+            return None
+        return slots
+    
+    def _get_line_mask(self) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Return the glyph coverage mask for the whole text, laid out with the pen starting at x=0.
+        
+        The mask only depends on the text and font, so it is reused when just colors, gap or
+        matrix size change.
+        
+        Returns:
+            (line mask, x offset of its first column relative to the pen start), or None if the
+            text has no visible pixels
+        """
+        key = (self.text, self._font_key)
+        if self._line_mask_key == key:
+            return self._line_mask
+        
+        slots = self._lookup_slots()
+        if slots is None:
+            self._build_glyph_atlas(_ATLAS_CHARS + self.text)
+            slots = self._lookup_slots()
+        
+        # Pen positions accumulate the (fractional) advances; glyphs land at the truncated pen + left bearing
+        pen = np.cumsum(self._glyph_advance[slots]) - self._glyph_advance[slots]
+        starts = pen.astype(np.intp) + self._glyph_left[slots]
+        widths = self._glyph_w[slots]
+        
+        self._line_mask = self._build_line_mask(slots, starts, widths)
+        self._line_mask_key = key
+        return self._line_mask
+    
+    def _build_line_mask(self, slots: np.ndarray, starts: np.ndarray,
+                         widths: np.ndarray) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Gather the coverage of the glyphs in slots, placed at columns starts, from the atlas.
+        
+        Returns:
+            (line mask, x offset of its first column), or None if the glyphs have no pixels
+        """
+        global _jit_unavailable
+        total_width = int(widths.sum())
+        if total_width == 0:
+            return None
+        
+        kernel = _get_compose_kernel() if total_width >= _JIT_MIN_COLUMNS else None
+        if kernel is not None:
+            x_lo = int(starts.min())
+            x_hi = int((starts + widths).max())
+            line_mask = np.zeros((self._atlas.shape[0], x_hi - x_lo), dtype=np.uint8)
+            try:
+                # Compiled kernel walks the atlas directly - no per-column index temporaries
+                kernel(line_mask, self._atlas, self._glyph_x[slots], widths, starts - x_lo)
+                return line_mask, x_lo
+            except Exception as e:
+                # e.g. a stale or unloadable Numba cache - stop trying and use NumPy from now on
+                self.logger.warning(f"Numba glyph kernel failed, falling back to NumPy: {e}")
+                _jit_unavailable = True
+        
+        # Map every output column to its source column in the atlas
+        within = np.arange(total_width) - np.repeat(np.cumsum(widths) - widths, widths)
+        dst_cols = np.repeat(starts, widths) + within
+        src_cols = np.repeat(self._glyph_x[slots], widths) + within
+        
+        x_lo = int(dst_cols.min())
+        x_hi = int(dst_cols.max()) + 1
+        line_mask = np.zeros((self._atlas.shape[0], x_hi - x_lo), dtype=np.uint8)
+        if np.all(np.diff(dst_cols) > 0):
+            line_mask[:, dst_cols - x_lo] = self._atlas[:, src_cols]
+            return line_mask, x_lo
+        
+        # Overlapping glyphs are composited over each other in text order, like PIL draws them.
+        # rank[j] is how many earlier glyphs also cover output column dst_cols[j]; each round handles
+        # one rank, so no round writes the same column twice.
+        order = np.argsort(dst_cols, kind='stable')
+        sorted_cols = dst_cols[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size) - np.searchsorted(sorted_cols, sorted_cols)
+        for r in range(int(rank.max()) + 1):
+            sel = rank == r
+            cols = dst_cols[sel] - x_lo
+            line_mask[:, cols] = _composite_over(line_mask[:, cols], self._atlas[:, src_cols[sel]])
+        return line_mask, x_lo
+    
+    def _blit_text(self, cache_arr: np.ndarray, x_pos: int, y_pos: int):
+        """Composite the text onto cache_arr from the glyph atlas, with the pen starting at (x_pos, y_pos)."""
+        line = self._get_line_mask()
+        if line is None:
+            return
+        line_mask, line_x = line
+        
+        # Clip the line to the cache
+        cache_height, cache_width = cache_arr.shape[:2]
+        x = x_pos + line_x
+        y = y_pos + self._atlas_top
+        x0, x1 = max(x, 0), min(x + line_mask.shape[1], cache_width)
+        y0, y1 = max(y, 0), min(y + line_mask.shape[0], cache_height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        # Blend text color over the background once for the whole line
+        coverage = line_mask[y0 - y:y1 - y, x0 - x:x1 - x, None].astype(np.uint16)
+        color = np.array(self.text_color, dtype=np.uint16)
+        bg = np.array(self.bg_color, dtype=np.uint16)
+        blend = coverage * color
+        blend += (255 - coverage) * bg
+        # Exact round(blend / 255) using shifts only: (t + 128 + ((t + 128) >> 8)) >> 8
+        blend += 128
+        blend += blend >> 8
+        np.right_shift(blend, 8, out=blend)
+        cache_arr[y0:y1, x0:x1] = blend
+    
+    def _text_cache_key(self, matrix_width: int, matrix_height: int) -> Tuple:
+        """Key of the current settings' strip in _TEXT_CACHE."""
+        return (self.text, self._font_key, self.text_color, self.bg_color,
+                self.scroll_gap_width, matrix_width, matrix_height)
+    
+    def _render_text_strip(self, cache_width: int, matrix_width: int, matrix_height: int, y_pos: int) -> np.ndarray:
+        """Return the rendered cache strip for the current settings, reusing a previous render when possible."""
+        global _TEXT_CACHE_BYTES
+        key = self._text_cache_key(matrix_width, matrix_height)
+        with _TEXT_CACHE_LOCK:
+            cache_arr = _TEXT_CACHE.get(key)
+            if cache_arr is not None:
+                _TEXT_CACHE.move_to_end(key)
+        if cache_arr is not None:
+            self.logger.debug("Reusing rendered text cache strip")
+            return cache_arr
+        
+        cache_arr = np.empty((matrix_height, cache_width, 3), dtype=np.uint8)
+        _fill_rgb(cache_arr, self.bg_color)
+        self._blit_text(cache_arr, matrix_width, y_pos)
+        # Strips are shared between plugin instances, so guard against in-place edits
+        cache_arr.flags.writeable = False
+        
+        if cache_arr.nbytes > _TEXT_CACHE_MAX_BYTES:
+            # Would evict everything else and still not fit
+            return cache_arr
+        with _TEXT_CACHE_LOCK:
+            old = _TEXT_CACHE.pop(key, None)
+            if old is not None:
+                # Another instance rendered the same strip meanwhile
+                _TEXT_CACHE_BYTES -= old.nbytes
+            _TEXT_CACHE[key] = cache_arr
+            _TEXT_CACHE_BYTES += cache_arr.nbytes
+            while _TEXT_CACHE_BYTES > _TEXT_CACHE_MAX_BYTES:
+                _TEXT_CACHE_BYTES -= _TEXT_CACHE.popitem(last=False)[1].nbytes
+        return cache_arr
+    
+    def _release_text_cache_entry(self):
+        """Drop the current strip from _TEXT_CACHE."""
+        global _TEXT_CACHE_BYTES
+        with _TEXT_CACHE_LOCK:
+            cache_arr = _TEXT_CACHE.pop(self._text_cache_key(self._matrix_width, self._matrix_height), None)
+            if cache_arr is not None:
+                _TEXT_CACHE_BYTES -= cache_arr.nbytes
+    
+    def _ensure_text_cache(self):
+        """
+        Build the scroll cache if it's missing or was rendered with different settings.
+        
+        A failed build isn't retried until its inputs change.
+        """
+        state = (self._cache_state(), self._matrix_width, self._matrix_height)
+        if self.text_image_cache and state == self._cache_sig:
+            return
+        if state == self._cache_failed_state:
+            return
+        # Never fall back to showing a strip rendered for other settings
+        self.text_image_cache = None
+        self._create_text_cache()
+        self._cache_failed_state = None if self.text_image_cache else state
+    
+    def _set_scrolling_image(self):
+        """Hand the text cache to ScrollHelper, sharing the cache strip instead of copying it when possible."""
+        if self._cache_view is not None and self._scroll_helper_takes_array:
+            self.scroll_helper.set_scrolling_image(self.text_image_cache, array=self._cache_view)
+        else:
+            self.scroll_helper.set_scrolling_image(self.text_image_cache)
+    
     def _create_text_cache(self):
         """Pre-render the text onto an image for smooth scrolling using ScrollHelper."""
         if not self.text or self.text_width == 0:
@@ -257,34 +794,43 @@ class TextDisplayPlugin(BasePlugin):
             return
         
         try:
-            matrix_width = self.display_manager.matrix.width
-            matrix_height = self.display_manager.matrix.height
+            matrix_width = self._matrix_width
+            matrix_height = self._matrix_height
             
             # Total width: initial padding + text + final padding (so text scrolls completely off) + gap
             # Structure: [display_width padding] [text] [display_width padding] [gap]
             # This ensures text starts off-screen right and scrolls completely off-screen left
             cache_width = matrix_width + self.text_width + matrix_width + self.scroll_gap_width
             
-            # Create cache image
-            self.text_image_cache = Image.new('RGB', (cache_width, matrix_height), self.bg_color)
-            draw = ImageDraw.Draw(self.text_image_cache)
+            # Calculate vertical centering (bbox measured in _calculate_text_dimensions)
+            y_pos = self._get_centered_y(matrix_height)
             
-            # Calculate vertical centering
-            temp_img = Image.new('RGB', (1, 1))
-            temp_draw = ImageDraw.Draw(temp_img)
-            bbox = temp_draw.textbbox((0, 0), self.text, font=self.font)
-            text_height = bbox[3] - bbox[1]
-            y_pos = (matrix_height - text_height) // 2 - bbox[1]
+            if self._uses_glyph_atlas():
+                # Compose the text from cached glyph tiles, starting after the initial display_width padding
+                cache_np = self._render_text_strip(cache_width, matrix_width, matrix_height, y_pos)
+                # Keep the array alongside the image so ScrollHelper can use it without converting the image
+                self._cache_view = cache_np
+                self.text_image_cache = Image.fromarray(cache_np)
+            else:
+                # Unknown font object - let PIL draw the whole string
+                self._cache_view = None
+                self.text_image_cache = Image.new('RGB', (cache_width, matrix_height), self.bg_color)
+                draw = ImageDraw.Draw(self.text_image_cache)
+                draw.text((matrix_width, y_pos), self.text, font=self.font, fill=self.text_color)
+                cache_np = np.asarray(self.text_image_cache, dtype=np.uint8)
             
-            # Draw text starting after the initial display_width padding
-            draw.text((matrix_width, y_pos), self.text, font=self.font, fill=self.text_color)
+            # Columns of the strip that differ from the background; windows outside them are identical
+            ink = np.flatnonzero((cache_np != np.array(self.bg_color, dtype=np.uint8)).any(axis=(0, 2)))
+            self._ink_cols = (int(ink[0]), int(ink[-1]) + 1) if ink.size else (0, 0)
             
-            # Ensure image is in RGB mode (required for numpy conversion)
-            if self.text_image_cache.mode != 'RGB':
-                self.text_image_cache = self.text_image_cache.convert('RGB')
+            # Both paths above build RGB directly; a convert() here would silently copy the whole strip
+            assert self.text_image_cache.mode == 'RGB'
             
             # Set the scrolling image in ScrollHelper
-            self.scroll_helper.set_scrolling_image(self.text_image_cache)
+            self._set_scrolling_image()
+            self._last_scroll_px = None
+            self._blank_pushed = False
+            self._cache_sig = (self._cache_state(), matrix_width, matrix_height)
             
             # Verify it was set correctly
             if self.scroll_helper.cached_image is None:
@@ -302,31 +848,104 @@ class TextDisplayPlugin(BasePlugin):
             self.logger.error(f"Failed to create text cache: {e}", exc_info=True)
             self.text_image_cache = None
     
+    def _copy_visible_portion(self, scroll_px: int, matrix_width: int, matrix_height: int) -> bool:
+        """
+        Write the window at integer scroll position scroll_px of the cache strip into display_manager.image.
+        
+        Returns False if the cache image or the display image can't be used, so the caller can fall back.
+        """
+        strip = self.text_image_cache
+        if strip is None or strip.height != matrix_height or strip.width <= matrix_width:
+            return False
+        target = getattr(self.display_manager, 'image', None)
+        if target is None or target.mode != 'RGB' or target.size != (matrix_width, matrix_height):
+            return False
+        
+        # Pasting the whole strip shifted left is clipped to the target - one copy, no crop() allocation
+        start = scroll_px % strip.width
+        target.paste(strip, (-start, 0))
+        if start + matrix_width > strip.width:
+            # Window wraps past the end of the strip: its first columns fill the rest
+            target.paste(strip, (strip.width - start, 0))
+        return True
+    
+    def _is_blank_window(self, scroll_px: int, matrix_width: int) -> bool:
+        """Whether the scroll window at scroll_px shows no text, only the strip's background."""
+        if self.text_image_cache is None or self._ink_cols is None:
+            return False
+        strip_width = self.text_image_cache.width
+        start = scroll_px % strip_width
+        end = start + matrix_width
+        ink_start, ink_end = self._ink_cols
+        if ink_start >= ink_end:
+            return True
+        # The window may wrap past the end of the strip back to its first columns
+        if ink_start < min(end, strip_width) and ink_end > start:
+            return False
+        return not (end > strip_width and ink_start < end - strip_width)
+    
+    def _get_frame_arr(self, matrix_width: int, matrix_height: int) -> np.ndarray:
+        """Return the reusable frame-sized scratch array (contents are undefined)."""
+        if self._frame_arr is None or self._frame_arr.shape != (matrix_height, matrix_width, 3):
+            self._frame_arr = np.empty((matrix_height, matrix_width, 3), dtype=np.uint8)
+        return self._frame_arr
+    
+    def _draw_text_frame(self, img: Image.Image, draw: ImageDraw.ImageDraw, x_pos: int, y_pos: int):
+        """
+        Redraw a matrix-sized RGB frame in place: background plus the text with its pen at (x_pos, y_pos).
+        
+        Pillow fonts reuse the laid-out glyph mask from the scroll cache, so only the color blend runs
+        here; other font objects are drawn with draw.text.
+        """
+        width, height = img.size
+        if self._uses_glyph_atlas():
+            frame = self._get_frame_arr(width, height)
+            _fill_rgb(frame, self.bg_color)
+            self._blit_text(frame, x_pos, y_pos)
+            img.frombytes(frame)
+        else:
+            img.paste(self.bg_color, (0, 0, width, height))
+            draw.text((x_pos, y_pos), self.text, font=self.font, fill=self.text_color)
+    
+    def _get_fallback_canvas(self, matrix_width: int, matrix_height: int) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+        """Return the reusable fallback frame and its draw context (redrawn with _draw_text_frame)."""
+        if self._fallback_img is None or self._fallback_img.size != (matrix_width, matrix_height):
+            self._fallback_img = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
+            self._fallback_draw = ImageDraw.Draw(self._fallback_img)
+        return self._fallback_img, self._fallback_draw
+    
+    def _push_frame(self, img: Image.Image):
+        """Push a reusable frame (fallback or static), copying it so it never becomes display_manager.image."""
+        if getattr(self.display_manager, 'image', None) is not None and self.display_manager.image.size == img.size:
+            self.display_manager.image.paste(img, (0, 0))
+        else:
+            self.display_manager.image = img.copy()
+        self.display_manager.update_display()
+    
     def update(self) -> None:
-        """Update scroll position if scrolling is enabled using ScrollHelper."""
-        if not self.scroll_enabled or self.text_width <= self.display_manager.matrix.width:
+        """
+        Prepare scrolling state: reset the scroll when text doesn't scroll and make sure the cache exists.
+        
+        The scroll position itself is only advanced in display(), once per rendered frame.
+        """
+        if not self._cache_ready.is_set() and not self._cache_ready.wait(timeout=0.01):
+            # Background cache build still running
+            return
+        
+        if not self.scroll_enabled or self.text_width <= self._matrix_width:
             # Reset scroll position if scrolling is disabled or text fits
             if self.scroll_helper:
                 self.scroll_helper.reset_scroll()
             return
         
-        # Ensure cache is created before updating scroll position
-        if not self.text_image_cache:
-            self._create_text_cache()
+        # Ensure cache is created before display() needs it
+        self._ensure_text_cache()
         
-        # Use ScrollHelper to update scroll position
         if self.scroll_helper and self.text_image_cache:
             # Verify scroll_helper has the image set
             if self.scroll_helper.cached_image is None:
                 self.logger.warning("ScrollHelper cached_image is None, re-setting scrolling image")
-                self.scroll_helper.set_scrolling_image(self.text_image_cache)
-            
-            # In one-shot mode, don't update if scroll is complete
-            if not self.scroll_loop and self.scroll_helper.is_scroll_complete():
-                # One-shot mode and complete - don't update position
-                return
-            
-            self.scroll_helper.update_scroll_position()
+                self._set_scrolling_image()
     
     def display(self, force_clear: bool = False) -> None:
         """
@@ -338,39 +957,42 @@ class TextDisplayPlugin(BasePlugin):
         if not self.text:
             return
         
+        if not self._cache_ready.is_set() and not self._cache_ready.wait(timeout=0.01):
+            # Background cache build still running - try again next frame
+            return
+        
         try:
-            matrix_width = self.display_manager.matrix.width
-            matrix_height = self.display_manager.matrix.height
+            matrix_width = self._matrix_width
+            matrix_height = self._matrix_height
             
             if self.scroll_enabled and self.text_width > matrix_width:
                 # Scrolling text - use ScrollHelper
-                if not self.text_image_cache:
-                    self._create_text_cache()
+                self._ensure_text_cache()
                 
                 if self.text_image_cache and self.scroll_helper:
                     # Verify scroll_helper has the image set
                     if self.scroll_helper.cached_image is None:
                         self.logger.warning("ScrollHelper cached_image is None in display(), re-setting scrolling image")
-                        self.scroll_helper.set_scrolling_image(self.text_image_cache)
+                        self._set_scrolling_image()
                     
                     # Update scroll position (handles time-based scrolling automatically)
                     # This ensures scroll position is updated every frame
+                    # Completion state is queried once and then tracked locally
                     was_complete = self.scroll_helper.is_scroll_complete()
+                    complete = was_complete
                     
                     # In one-shot mode, don't update if scroll is already complete
-                    if not self.scroll_loop and was_complete:
-                        # One-shot mode and already complete - don't update position
-                        is_now_complete = True
-                    else:
+                    if self.scroll_loop or not was_complete:
                         # Update scroll position (will handle completion)
                         self.scroll_helper.update_scroll_position()
-                        is_now_complete = self.scroll_helper.is_scroll_complete()
+                        complete = self.scroll_helper.is_scroll_complete()
                         
                         # Handle scroll completion based on loop setting
-                        if is_now_complete:
+                        if complete:
                             if self.scroll_loop:
                                 # Continuous looping mode - reset when complete
                                 self.scroll_helper.reset_scroll()
+                                complete = False
                                 if not was_complete:
                                     # Just completed this frame
                                     self.logger.debug("Scroll completed and reset for continuous loop")
@@ -384,115 +1006,145 @@ class TextDisplayPlugin(BasePlugin):
                                     self.logger.info("Scroll completed in one-shot mode - stopping")
                     
                     # Signal scrolling state to display manager
-                    if hasattr(self.display_manager, 'set_scrolling_state'):
-                        # Only signal scrolling if not complete (or if looping and will reset)
-                        if not self.scroll_helper.is_scroll_complete() or (self.scroll_loop and self.scroll_helper.is_scroll_complete()):
-                            self.display_manager.set_scrolling_state(True)
-                        else:
-                            # One-shot mode and complete - stop scrolling
-                            self.display_manager.set_scrolling_state(False)
+                    if self._set_scrolling_state is not None:
+                        # Keep signalling scrolling unless a one-shot scroll has finished
+                        self._set_scrolling_state(self.scroll_loop or not complete)
                     
-                    # Get visible portion from ScrollHelper
-                    visible_image = self.scroll_helper.get_visible_portion()
+                    # Nothing visible changes until the integer scroll position advances (sub-pixel speeds).
+                    # ScrollHelper keeps a float position; it is truncated once here and only scroll_px is used below.
+                    scroll_px = int(self.scroll_helper.scroll_position)
+                    if scroll_px == self._last_scroll_px and not force_clear:
+                        # Still a display loop frame - the FPS log measures the loop, not matrix pushes
+                        self._log_frame_rate()
+                        return
+                    self._last_scroll_px = scroll_px
+                    self._static_shown = False
+                    
+                    # While the window is in the padding/gap, every frame is plain background - push it once
+                    blank = self._is_blank_window(scroll_px, matrix_width)
+                    if blank and self._blank_pushed and not force_clear:
+                        self._log_frame_rate()
+                        return
+                    
+                    # Copy the visible window straight from the cache array when possible
+                    if self._copy_visible_portion(scroll_px, matrix_width, matrix_height):
+                        visible_image = self.display_manager.image
+                    else:
+                        # Get visible portion from ScrollHelper
+                        visible_image = self.scroll_helper.get_visible_portion()
+                        if visible_image:
+                            # Ensure display_manager.image exists and is the right size
+                            if not hasattr(self.display_manager, 'image') or self.display_manager.image is None:
+                                self.display_manager.image = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
+                            
+                            # Update display with visible portion (use paste like odds-ticker)
+                            self.display_manager.image.paste(visible_image, (0, 0))
                     
                     if visible_image:
-                        # Ensure display_manager.image exists and is the right size
-                        if not hasattr(self.display_manager, 'image') or self.display_manager.image is None:
-                            self.display_manager.image = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
-                        
-                        # Update display with visible portion (use paste like odds-ticker)
-                        self.display_manager.image.paste(visible_image, (0, 0))
                         self.display_manager.update_display()
+                        self._blank_pushed = blank
                         
                         # Log frame rate for scrolling text
                         self._log_frame_rate()
                         
-                        self.logger.debug(f"Displayed visible portion: scroll_position={self.scroll_helper.scroll_position:.2f}, "
-                                        f"image_size={visible_image.size}")
+                        # Formatting this every frame costs about as much as the paste itself, so only when it's logged
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Displayed visible portion: scroll_position={self.scroll_helper.scroll_position:.2f}, "
+                                            f"image_size={visible_image.size}")
                     else:
                         self.logger.warning("ScrollHelper.get_visible_portion() returned None, using fallback")
                         # Fallback: direct draw
-                        img = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
-                        draw = ImageDraw.Draw(img)
-                        bbox = draw.textbbox((0, 0), self.text, font=self.font)
-                        text_height = bbox[3] - bbox[1]
-                        y_pos = (matrix_height - text_height) // 2 - bbox[1]
-                        draw.text((0, y_pos), self.text, font=self.font, fill=self.text_color)
-                        if not hasattr(self.display_manager, 'image') or self.display_manager.image is None:
-                            self.display_manager.image = img
-                        else:
-                            self.display_manager.image.paste(img, (0, 0))
-                        self.display_manager.update_display()
+                        img, draw = self._get_fallback_canvas(matrix_width, matrix_height)
+                        y_pos = self._get_centered_y(matrix_height)
+                        self._draw_text_frame(img, draw, 0, y_pos)
+                        self._push_frame(img)
                 else:
-                    # Fallback: static text if cache creation failed
-                    img = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
-                    draw = ImageDraw.Draw(img)
-                    bbox = draw.textbbox((0, 0), self.text, font=self.font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    x_pos = (matrix_width - text_width) // 2
-                    y_pos = (matrix_height - text_height) // 2 - bbox[1]
-                    draw.text((x_pos, y_pos), self.text, font=self.font, fill=self.text_color)
-                    self.display_manager.image = img
-                    self.display_manager.update_display()
+                    # Fallback: static text if cache creation failed - rendered and pushed once like static text,
+                    # since _ensure_text_cache won't retry until the settings change
+                    self._display_static(matrix_width, matrix_height, force_clear)
             else:
-                # Static text (centered)
-                img = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
-                draw = ImageDraw.Draw(img)
-                bbox = draw.textbbox((0, 0), self.text, font=self.font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                x_pos = (matrix_width - text_width) // 2
-                y_pos = (matrix_height - text_height) // 2 - bbox[1]
-                draw.text((x_pos, y_pos), self.text, font=self.font, fill=self.text_color)
-                self.display_manager.image = img
-                self.display_manager.update_display()
+                self._display_static(matrix_width, matrix_height, force_clear)
             
         except Exception as e:
             self.logger.error(f"Error displaying text: {e}")
     
+    def _display_static(self, matrix_width: int, matrix_height: int, force_clear: bool):
+        """Show the text centered - rendered once and reused until anything it depends on changes."""
+        static_key = (self.text, self._font_key, self.text_color, self.bg_color,
+                      matrix_width, matrix_height)
+        if static_key != self._static_key:
+            # Forget the old key first so a failed redraw is never shown as current
+            self._static_key = None
+            if self._static_image is None or self._static_image.size != (matrix_width, matrix_height):
+                self._static_image = Image.new('RGB', (matrix_width, matrix_height), self.bg_color)
+                self._static_draw = ImageDraw.Draw(self._static_image)
+            bbox = self._get_text_bbox()
+            x_pos = (matrix_width - (bbox[2] - bbox[0])) // 2
+            y_pos = self._get_centered_y(matrix_height)
+            self._draw_text_frame(self._static_image, self._static_draw, x_pos, y_pos)
+            self._static_key = static_key
+            self._static_shown = False
+        
+        # Make sure the first scrolling frame after a switch back is pushed
+        self._last_scroll_px = None
+        self._blank_pushed = False
+        # The matrix already shows this frame - don't push it again
+        if self._static_shown and not force_clear:
+            return
+        
+        # Copied into the display buffer so nothing drawn there later can alter the cached frame
+        self._push_frame(self._static_image)
+        self._static_shown = True
+    
     def _log_frame_rate(self):
         """Log frame rate statistics for scrolling text."""
         if not self.scroll_enabled:
             return
         
-        current_time = time.time()
+        # Monotonic clock: cheaper than time.time() and immune to wall-clock jumps
+        current_time = time.monotonic()
         
         # Initialize timing on first call
         if self.last_frame_time is None:
             self.last_frame_time = current_time
-            self.last_fps_log_time = current_time
+            self._next_fps_log = current_time + 5.0
             return
         
         # Calculate instantaneous frame time
         frame_time = current_time - self.last_frame_time
-        self.frame_times.append(frame_time)
+        self.last_frame_time = current_time
+        self.frame_count += 1
         
-        # Keep only last 100 frames for average
-        if len(self.frame_times) > 100:
-            self.frame_times.pop(0)
+        # Keep only last 100 frames for average (overwrite the oldest slot)
+        self._ft_sum += frame_time - self._ft_buf[self._ft_idx]
+        self._ft_buf[self._ft_idx] = frame_time
+        self._ft_idx = (self._ft_idx + 1) % self._ft_buf.size
+        self._ft_n = min(self._ft_n + 1, self._ft_buf.size)
         
-        # Log FPS every 5 seconds to avoid spam
-        if current_time - self.last_fps_log_time >= 5.0:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times) if self.frame_times else frame_time
-            avg_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-            instant_fps = 1.0 / frame_time if frame_time > 0 else 0
-            
-            self.logger.info(
-                f"Text display FPS - Avg: {avg_fps:.1f}, Current: {instant_fps:.1f}, "
-                f"Frame time: {frame_time*1000:.2f}ms, Target: {self.target_fps:.0f} FPS"
-            )
-            self.last_fps_log_time = current_time
-            self.frame_count = 0
+        # Log FPS every 5 seconds to avoid spam - skip the stats/formatting until then
+        if current_time < self._next_fps_log:
+            return
         
-        self.last_frame_time = current_time
-        self.frame_count += 1
+        avg_frame_time = self._ft_sum / self._ft_n if self._ft_n else frame_time
+        avg_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+        instant_fps = 1.0 / frame_time if frame_time > 0 else 0
+        
+        self.logger.info(
+            f"Text display FPS - Avg: {avg_fps:.1f}, Current: {instant_fps:.1f}, "
+            f"Frame time: {frame_time*1000:.2f}ms, Target: {self.target_fps:.0f} FPS"
+        )
+        self._next_fps_log = current_time + 5.0
+        self.frame_count = 0
     
     def set_text(self, text: str):
         """Update the displayed text."""
+        # Don't race the initial background cache build
+        self._cache_ready.wait()
         self.text = text
+        self._codes = np.fromiter(map(ord, text), dtype=np.uint32, count=len(text))
         self._calculate_text_dimensions()
         self.text_image_cache = None
+        self._last_scroll_px = None
         if self.scroll_helper:
             self.scroll_helper.reset_scroll()
         self.logger.info(f"Text updated to: '{text[:30]}...'")
@@ -517,18 +1169,16 @@ class TextDisplayPlugin(BasePlugin):
             self.logger.error("No text specified")
             return False
         
-        # Validate colors
-        for color_name, color_value in [("text_color", self.text_color), ("background_color", self.bg_color)]:
-            if not isinstance(color_value, tuple) or len(color_value) != 3:
-                self.logger.error(f"Invalid {color_name}: must be RGB tuple")
-                return False
+        # Validate the configured colors - __init__ replaces invalid ones with defaults, so the parsed
+        # text_color/bg_color would always pass
+        for color_name, default in [("text_color", [255, 255, 255]), ("background_color", [0, 0, 0])]:
+            color_value = self.config.get(color_name, default)
             try:
-                # Convert to integers and validate range
-                color_ints = [int(c) for c in color_value]
-                if not all(0 <= c <= 255 for c in color_ints):
-                    self.logger.error(f"Invalid {color_name}: values must be 0-255")
-                    return False
-            except (ValueError, TypeError):
+                _parse_color(color_value)
+            except ValueError as e:
+                self.logger.error(f"Invalid {color_name}: {e}")
+                return False
+            except TypeError:
                 self.logger.error(f"Invalid {color_name}: values must be numeric")
                 return False
         
@@ -537,6 +1187,11 @@ class TextDisplayPlugin(BasePlugin):
     def on_config_change(self, new_config: Dict[str, Any]) -> None:
         """Handle configuration changes at runtime."""
         super().on_config_change(new_config)
+        # Don't race the initial background cache build
+        self._cache_ready.wait()
+        
+        # The scroll cache checks its own inputs (_ensure_text_cache); only font registration is tracked here
+        old_font_registration = (self.font_size, self.text_color)
         
         # Update text if changed
         new_text = new_config.get('text', self.text)
@@ -571,8 +1226,7 @@ class TextDisplayPlugin(BasePlugin):
                 self.scroll_helper.set_scroll_speed(self.scroll_speed)
             else:
                 # Fallback: calculate pixels per second
-                pixels_per_second = self.scroll_speed / self.scroll_delay if self.scroll_delay > 0 else self.scroll_speed * 100
-                self.scroll_helper.set_scroll_speed(pixels_per_second)
+                self.scroll_helper.set_scroll_speed(self._pixels_per_second())
                 
             self.scroll_helper.set_scroll_delay(self.scroll_delay)
             # Clamp target FPS to valid range
@@ -584,7 +1238,6 @@ class TextDisplayPlugin(BasePlugin):
         if old_scroll_enabled != self.scroll_enabled:
             if self.scroll_helper:
                 self.scroll_helper.reset_scroll()
-            self.text_image_cache = None  # Invalidate cache when scroll state changes
             self.logger.info(f"Scroll {'enabled' if self.scroll_enabled else 'disabled'}")
         
         # Update font settings if changed
@@ -593,37 +1246,45 @@ class TextDisplayPlugin(BasePlugin):
         if new_font_path != self.font_path or new_font_size != self.font_size:
             self.font_path = new_font_path
             self.font_size = new_font_size
-            self.font = self._load_font()
+            self.font, self._font_key = self._load_font()
             self._calculate_text_dimensions()
-            self.text_image_cache = None  # Invalidate cache when font changes
-            self._register_fonts()
         
         # Update colors if changed
         try:
             text_color_raw = new_config.get('text_color')
             if text_color_raw:
-                self.text_color = tuple(int(c) for c in text_color_raw)
+                self.text_color = _parse_color(text_color_raw)
             
             bg_color_raw = new_config.get('background_color')
             if bg_color_raw:
-                self.bg_color = tuple(int(c) for c in bg_color_raw)
-                self.text_image_cache = None  # Invalidate cache when background color changes
+                self.bg_color = _parse_color(bg_color_raw)
         except (ValueError, TypeError) as e:
             self.logger.warning(f"Invalid color values in config update: {e}")
+        
+        # The font manager only gets the size and color, so a path change alone doesn't need re-registering
+        if (self.font_size, self.text_color) != old_font_registration:
+            self._register_fonts()
+    
+    def _cache_state(self) -> Tuple:
+        """Settings the rendered scroll cache depends on."""
+        return (self.text, self._font_key, self.text_color, self.bg_color, self.scroll_gap_width)
+    
+    def _pixels_per_second(self) -> float:
+        """Scroll speed in pixels per second, derived from the frame-based speed and delay settings."""
+        return self.scroll_speed / self.scroll_delay if self.scroll_delay > 0 else self.scroll_speed * 100
     
     def get_info(self) -> Dict[str, Any]:
         """Return plugin info for web UI."""
         info = super().get_info()
-        # Calculate pixels per second for display
-        pixels_per_second = self.scroll_speed / self.scroll_delay if self.scroll_delay > 0 else self.scroll_speed * 100
         info.update({
-            'text': self.text[:50] if len(self.text) > 50 else self.text,
+            # Slicing returns the string itself when it's already short enough - no copy
+            'text': self.text[:50],
             'text_width': self.text_width,
             'scroll_enabled': self.scroll_enabled,
             'scroll_speed': self.scroll_speed,  # pixels per frame
             'scroll_delay': self.scroll_delay,  # seconds per frame
             'target_fps': self.target_fps,
-            'pixels_per_second': round(pixels_per_second, 1),  # calculated from frame-based settings
+            'pixels_per_second': round(self._pixels_per_second(), 1),  # calculated from frame-based settings
             'scroll_loop': self.scroll_loop,
             'font_path': self.font_path,
             'font_size': self.font_size
@@ -632,8 +1293,29 @@ class TextDisplayPlugin(BasePlugin):
     
     def cleanup(self) -> None:
         """Cleanup resources."""
+        # Let the initial background cache build finish so it can't repopulate anything after this
+        self._cache_ready.wait()
         if self.scroll_helper:
             self.scroll_helper.clear_cache()
+        # Other instances showing the same strip keep their own reference to it
+        self._release_text_cache_entry()
         self.text_image_cache = None
+        self._cache_view = None
+        self._ink_cols = None
+        self._static_image = None
+        self._static_draw = None
+        self._static_key = None
+        self._static_shown = False
+        self._frame_arr = None
+        self._fallback_img = None
+        self._fallback_draw = None
+        self._line_mask = None
+        self._line_mask_key = None
+        self._atlas = None
+        self._atlas_key = None
+        self._glyph_codes = np.empty(0, dtype=np.uint32)
+        # Pillow fonts stay shared through the module-level loader caches; a freetype face is ours alone
+        if self._is_freetype_face():
+            self.font = None
         self.logger.info("Text display plugin cleaned up")
 